@@ -1,3 +1,4 @@
+import threading
 import uuid
 from datetime import datetime, timedelta
 
@@ -18,6 +19,17 @@ def now():
     return datetime.utcnow().replace(tzinfo=utc)
 
 
+# The parser keeps the state of the current document, each thread reuses its own instance.
+PARSERS = threading.local()
+
+
+def make_html(text):
+    parser = getattr(PARSERS, "markdown", None)
+    if parser is None:
+        parser = PARSERS.markdown = mistune.Markdown(escape=True)
+    return parser(text)
+
+
 MAX_UID_LEN = 255
 MAX_NAME_LEN = 255
 MAX_TEXT_LEN = 10000
@@ -119,7 +131,7 @@ class Profile(models.Model):
 
     def save(self, *args, **kwargs):
         self.uid = self.uid or util.get_uuid(8)
-        self.html = self.html or mistune.markdown(self.text)
+        self.html = self.html or make_html(self.text)
         self.max_upload_size = self.max_upload_size or settings.MAX_UPLOAD_SIZE
         self.name = self.name or self.user.first_name or self.user.email.split("@")[0]
         self.date_joined = self.date_joined or now()
@@ -162,7 +174,7 @@ class MessageBody(models.Model):
     html = models.TextField(default='', max_length=MAX_TEXT_LEN * 10)
 
     def save(self, *args, **kwargs):
-        self.html = self.html or mistune.markdown(self.body)
+        self.html = self.html or make_html(self.body)
         super(MessageBody, self).save(**kwargs)
 
 
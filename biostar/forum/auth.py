@@ -5,6 +5,7 @@ from django.template import loader
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.db import transaction
 from django.db.models import F
 from django.utils.timezone import utc
@@ -18,6 +19,9 @@ User = get_user_model()
 
 logger = logging.getLogger("engine")
 
+# Related objects accessed when rendering a post.
+POST_SELECT_RELATED = ("root", "author", "author__profile", "lastedit_user", "lastedit_user__profile")
+
 
 def get_votes(user, root):
     store = {
@@ -67,15 +71,12 @@ def post_tree(user, root):
     Answers sorted before comments.
     """
 
-    # Get all posts that belong to post root.
-    query = Post.objects.filter(root=root).exclude(pk=root.id)
-
-    # Add all related objects.
-    query = query.select_related("lastedit_user__profile", "lastedit_user", "root__lastedit_user",
-                                 "root__lastedit_user__profile", "root__author__profile", "author__profile")
-
     is_moderator = user.is_authenticated and user.profile.is_moderator
 
+    # Get all posts that belong to post root, with the related objects used during rendering.
+    query = Post.objects.filter(root=root).exclude(pk=root.id)
+    query = query.select_related(*POST_SELECT_RELATED, "root__author__profile", "root__lastedit_user__profile")
+
     # Only moderators
     if not is_moderator:
         query = query.exclude(status=Post.DELETED)
@@ -98,9 +99,9 @@ def post_tree(user, root):
             comment_tree.setdefault(post.parent_id, []).append(post)
         post.has_bookmark = int(post.id in bookmarks)
         post.has_upvote = int(post.id in upvotes)
-        post.can_accept = not post.is_toplevel and (user == post.root.author or (user.is_authenticated and user.profile.is_moderator))
-        post.can_moderate = user.is_authenticated and user.profile.is_moderator
-        post.is_editable = user.is_authenticated and (user == post.author or (user.is_authenticated and user.profile.is_moderator))
+        post.can_accept = not post.is_toplevel and (user == post.root.author or is_moderator)
+        post.can_moderate = is_moderator
+        post.is_editable = user.is_authenticated and (user == post.author or is_moderator)
         return post
 
     # Decorate the objects for easier access
@@ -127,10 +128,17 @@ def update_post_views(post, request, minutes=settings.POST_VIEW_MINUTES):
     ip = ip1 or ip2 or '0.0.0.0'
 
     now = util.now()
-    since = now - datetime.timedelta(minutes=minutes)
 
     # One view per time interval from each IP address.
-    if not PostView.objects.filter(ip=ip, post=post, date__gt=since).exists():
+    if settings.POST_VIEW_CACHE:
+        # Adding a key is atomic and fails when it is already present.
+        is_new = caches[settings.POST_VIEW_CACHE].add(f"post-view-{post.pk}-{ip}", 1, timeout=minutes * 60)
+    else:
+        # Without a cache shared by all processes check the stored views instead.
+        since = now - datetime.timedelta(minutes=minutes)
+        is_new = not PostView.objects.filter(ip=ip, post=post, date__gt=since).exists()
+
+    if is_new:
         # Update the last time
         PostView.objects.create(ip=ip, post=post, date=now)
         Post.objects.filter(pk=post.pk).update(view_count=F('view_count') + 1)
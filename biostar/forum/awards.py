@@ -195,7 +195,7 @@ SCHOLAR = AwardDef(
 PROPHET = AwardDef(
     name="Prophet",
     desc="created a post with more than 20 followers",
-    func=lambda user: Post.objects.filter(author=user, type__in=Post.TOP_LEVEL, subs_count__gt=20),
+    func=lambda user: Post.objects.filter(author=user, is_toplevel=True, subs_count__gt=20),
     max=1,
     icon="leaf icon"
 )
@@ -203,7 +203,7 @@ PROPHET = AwardDef(
 LIBRARIAN = AwardDef(
     name="Librarian",
     desc="created a post with more than 10 bookmarks",
-    func=lambda user: Post.objects.filter(author=user, type__in=Post.TOP_LEVEL, book_count__gt=10),
+    func=lambda user: Post.objects.filter(author=user, is_toplevel=True, book_count__gt=10),
     max=1,
     icon="bookmark outline icon"
 )
@@ -0,0 +1,21 @@
+# Generated by Django 2.2.28 on 2026-10-15 11:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0005_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['root', 'type', '-accept_count', '-vote_count', 'creation_date'], name='post_thread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_toplevel', '-rank'], name='post_toplevel_idx'),
+        ),
+    ]
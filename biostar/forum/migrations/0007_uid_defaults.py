@@ -0,0 +1,29 @@
+# Generated by Django 2.2.28 on 2026-10-15 12:01
+
+import biostar.forum.util
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0006_post_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='award',
+            name='uid',
+            field=models.CharField(default=biostar.forum.util.get_uid, max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='subscription',
+            name='uid',
+            field=models.CharField(default=biostar.forum.util.get_uid, max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='vote',
+            name='uid',
+            field=models.CharField(default=biostar.forum.util.get_uid, max_length=32, unique=True),
+        ),
+    ]
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 
 import bleach
@@ -5,6 +6,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
 from django.db import models
+from django.db.models import OuterRef
 from django.shortcuts import reverse
 from taggit.managers import TaggableManager
 
@@ -39,12 +41,20 @@ class Post(models.Model):
         (DATA, "Data"), (PAGE, "Page"), (TOOL, "Tool"), (NEWS, "News"),
         (BLOG, "Blog"), (BOARD, "Bulletin Board")
     ]
-    TOP_LEVEL = {QUESTION, JOB, FORUM, BLOG, TUTORIAL, TOOL, NEWS}
+    TOP_LEVEL = frozenset((QUESTION, JOB, FORUM, BLOG, TUTORIAL, TOOL, NEWS))
 
     # Possile spam states.
     SPAM, NOT_SPAM, DEFAULT = range(3)
     SPAM_CHOICES = [(SPAM, "Spam"), (NOT_SPAM, "Not spam"), (DEFAULT, "Default")]
 
+    class Meta:
+        # Match the filtering and ordering of the thread view and the post list.
+        indexes = [
+            models.Index(fields=["root", "type", "-accept_count", "-vote_count", "creation_date"],
+                         name="post_thread_idx"),
+            models.Index(fields=["is_toplevel", "-rank"], name="post_toplevel_idx"),
+        ]
+
     # Post status: open, closed, deleted.
     status = models.IntegerField(choices=STATUS_CHOICES, default=OPEN, db_index=True)
 
@@ -125,6 +135,9 @@ class Post(models.Model):
     # This is the  HTML that gets displayed.
     html = models.TextField(default='')
 
+    # Digest of the content the HTML was rendered from.
+    content_hash = models.CharField(max_length=16, default="", blank=True)
+
     # The tag value is the canonical form of the post's tags
     tag_val = models.CharField(max_length=100, default="", blank=True)
 
@@ -141,7 +154,7 @@ class Post(models.Model):
     spam = models.IntegerField(choices=SPAM_CHOICES, default=DEFAULT)
 
     def parse_tags(self):
-        return [tag.lower() for tag in self.tag_val.split(",") if tag]
+        return [tag for tag in self.tag_val.lower().split(",") if tag]
 
     @property
     def get_votecount(self):
@@ -185,8 +198,12 @@ class Post(models.Model):
         self.lastedit_date = util.now()
         self.last_contributor = self.lastedit_user
 
-        # Sanitize the post body.
-        self.html = markdown.parse(self.content, post=self)
+        # Sanitize the post body, only when the content has changed since the last render.
+        content_hash = hashlib.blake2b(self.content.encode("utf-8"), digest_size=8).hexdigest()
+        if content_hash != self.content_hash or not self.html:
+            self.html = markdown.parse(self.content, post=self)
+            self.content_hash = content_hash
+
         self.tag_val = self.tag_val.replace(' ', '')
         # Default tags
         self.tag_val = self.tag_val or "tag1,tag2"
@@ -223,6 +240,14 @@ class Post(models.Model):
         return delta.days
 
 
+def count_posts(field, **kwargs):
+    """
+    Subquery counting the posts linked to the outer post by a field, the outer post excluded.
+    """
+    query = Post.objects.filter(**{field: OuterRef("pk")}, **kwargs).exclude(pk=OuterRef("pk"))
+    return util.count_subquery(query)
+
+
 class Vote(models.Model):
     # Post statuses.
 
@@ -236,16 +261,11 @@ class Vote(models.Model):
     type = models.IntegerField(choices=TYPE_CHOICES, default=EMPTY, db_index=True)
     date = models.DateTimeField(auto_now_add=True, db_index=True)
 
-    uid = models.CharField(max_length=32, unique=True)
+    uid = models.CharField(max_length=32, unique=True, default=util.get_uid)
 
     def __str__(self):
         return u"Vote: %s, %s, %s" % (self.post_id, self.author_id, self.get_type_display())
 
-    def save(self, *args, **kwargs):
-        self.uid = self.uid or util.get_uuid(limit=16)
-
-        super(Vote, self).save(*args, **kwargs)
-
 
 class PostView(models.Model):
     """
@@ -264,7 +284,7 @@ class Subscription(models.Model):
     class Meta:
         unique_together = (("user", "post"))
 
-    uid = models.CharField(max_length=32, unique=True)
+    uid = models.CharField(max_length=32, unique=True, default=util.get_uid)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     post = models.ForeignKey(Post, related_name="subs", on_delete=models.CASCADE)
     type = models.IntegerField(choices=SUB_CHOICES, null=True, default=LOCAL_MESSAGE)
@@ -276,7 +296,6 @@ class Subscription(models.Model):
     def save(self, *args, **kwargs):
         # Set the date to current time if missing.
         self.date = self.date or util.now()
-        self.uid = self.uid or util.get_uuid(limit=16)
         type_map = {Profile.NO_MESSAGES: self.NO_MESSAGES,
                     Profile.EMAIL_MESSAGE: self.EMAIL_MESSAGE,
                     Profile.LOCAL_MESSAGE: self.LOCAL_MESSAGE,
@@ -330,9 +349,4 @@ class Award(models.Model):
     post = models.ForeignKey(Post, null=True, on_delete=models.SET_NULL)
     date = models.DateTimeField()
     # context = models.CharField(max_length=1000, default='')
-    uid = models.CharField(max_length=32, unique=True)
-
-    def save(self, *args, **kwargs):
-        # Set the date to current time if missing.
-        self.uid = self.uid or util.get_uuid(limit=16)
-        super(Award, self).save(*args, **kwargs)
+    uid = models.CharField(max_length=32, unique=True, default=util.get_uid)
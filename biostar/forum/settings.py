@@ -81,6 +81,10 @@ WSGI_APPLICATION = 'biostar.wsgi.application'
 # Time between two accesses from the same IP to qualify as a different view.
 POST_VIEW_MINUTES = 7
 
+# Cache alias shared by all processes (redis, memcached) used to skip repeated views.
+# When not set the stored post views are queried instead.
+POST_VIEW_CACHE = None
+
 COUNT_INTERVAL_WEEKS = 10000
 
 # This flag is used flag situation where a data migration is in progress.
@@ -1,17 +1,17 @@
 import logging
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from taggit.models import Tag
-from django.db.models import F, Q
+from django.db.models import Q
 from biostar.accounts.models import Profile, Message
-from .models import Post, Award, Subscription
+from .models import Post, Award, Subscription, count_posts
+from biostar.utils import markdown
 from . import tasks, auth, util
 
 
 logger = logging.getLogger("biostar")
 
 
-@receiver(post_save, sender=Award)
+@receiver(post_save, sender=Award, dispatch_uid="award_message")
 def send_award_message(sender, instance, created, **kwargs):
     """
     Send message to users when they receive an award.
@@ -25,7 +25,7 @@ def send_award_message(sender, instance, created, **kwargs):
     return
 
 
-@receiver(post_save, sender=Profile)
+@receiver(post_save, sender=Profile, dispatch_uid="ban_user")
 def ban_user(sender, instance, created, **kwargs):
     """
     Delete all posts and awards belonging to a banned user.
@@ -48,16 +48,15 @@ def ban_user(sender, instance, created, **kwargs):
         Message.objects.filter(Q(sender=instance.user) | Q(recipient=instance.user)).delete()
 
 
-@receiver(post_save, sender=Post)
+@receiver(post_save, sender=Post, dispatch_uid="post_finalize")
 def finalize_post(sender, instance, created, **kwargs):
 
     # Determine the root of the post.
     root = instance.root if instance.root is not None else instance
 
-    # Add tags
+    # Add tags, the manager looks up and creates the tags by name in bulk.
     instance.tags.clear()
-    tags = [Tag.objects.get_or_create(name=name)[0] for name in instance.parse_tags()]
-    instance.tags.add(*tags)
+    instance.tags.add(*instance.parse_tags())
 
     # Update last contributor, last editor, and last edit date to the thread
     Post.objects.filter(uid=root.uid).update(lastedit_user=instance.lastedit_user,
@@ -71,6 +70,9 @@ def finalize_post(sender, instance, created, **kwargs):
         # Make the Uid user friendly
         instance.uid = instance.uid or f"p{instance.pk}"
 
+        # Mentions are subscribed to the root, which a new post without a parent did not have when rendered.
+        new_root = instance.parent is None
+
         if instance.parent:
             # When the parent is set the root must follow the parent root.
             instance.root = instance.parent.root
@@ -81,6 +83,7 @@ def finalize_post(sender, instance, created, **kwargs):
         # Answers and comments may only have comments associated with them.
         if instance.parent.type in (Post.ANSWER, Post.COMMENT):
             instance.type = Post.COMMENT
+            instance.is_toplevel = False
 
         # Sanity check.
         assert instance.root and instance.parent
@@ -97,29 +100,33 @@ def finalize_post(sender, instance, created, **kwargs):
         # Update this post rank on create and not every edit.
         instance.rank = instance.lastedit_date.timestamp()
 
-        # Save the instance.
-        instance.save()
+        # Store the fields set above without running save() and the signals a second time.
+        Post.objects.filter(pk=instance.pk).update(uid=instance.uid, root=instance.root, parent=instance.parent,
+                                                   type=instance.type, is_toplevel=instance.is_toplevel,
+                                                   title=instance.title, rank=instance.rank)
 
-        descendants = Post.objects.filter(root=instance.root).exclude(pk=instance.root.pk)
-        answer_count = descendants.filter(type=Post.ANSWER).count()
-        comment_count = descendants.filter(type=Post.COMMENT).count()
-        reply_count = descendants.count()
-        # Update the root reply, answer, and comment counts.
-        Post.objects.filter(pk=instance.root.pk).update(reply_count=reply_count, answer_count=answer_count,
-                                                        comment_count=comment_count)
+        # Update the root reply, answer, and comment counts in a single statement.
+        Post.objects.filter(pk=instance.root.pk).update(reply_count=count_posts("root"),
+                                                        answer_count=count_posts("root", type=Post.ANSWER),
+                                                        comment_count=count_posts("root", type=Post.COMMENT))
 
-        children = Post.objects.filter(parent=instance.parent).exclude(pk=instance.parent.pk)
-        com_count = children.filter(type=Post.COMMENT).count()
-        # Update parent reply, answer, and comment counts.
-        Post.objects.filter(pk=instance.parent.pk, is_toplevel=False).update(comment_count=com_count,
-                                                                             reply_count=children.count())
+        # Update parent reply and comment counts.
+        Post.objects.filter(pk=instance.parent.pk, is_toplevel=False).update(
+            comment_count=count_posts("parent", type=Post.COMMENT),
+            reply_count=count_posts("parent"))
 
-        # Bump the root rank when a new descendant is added.
-        Post.objects.filter(uid=instance.root.uid).update(rank=util.now().timestamp())
+        # Bump the root rank and set the thread editor and contributor now that the root is known.
+        Post.objects.filter(pk=instance.root.pk).update(rank=util.now().timestamp(),
+                                                        lastedit_user=instance.lastedit_user,
+                                                        last_contributor=instance.last_contributor,
+                                                        lastedit_date=instance.lastedit_date)
 
         # Create subscription to the root.
         auth.create_subscription(post=instance.root, user=instance.author)
 
+        if new_root:
+            markdown.subscribe_mentions(instance.content, root=instance.root)
+
         # Get all subscribed users when a new post is created
         subs = Subscription.objects.filter(post=instance.root)
 
@@ -15,7 +15,7 @@ from django.utils.safestring import mark_safe
 from django.utils.timezone import utc
 
 from biostar.accounts.models import Profile, Message
-from biostar.forum import const
+from biostar.forum import const, auth
 from biostar.forum.models import Post, Vote, Award, Subscription
 
 User = get_user_model()
@@ -327,8 +327,7 @@ def list_posts(context, target):
     user = request.user
     posts = Post.objects.filter(author=target)
     page = request.GET.get('page', 1)
-    posts = posts.prefetch_related("root", "author__profile",
-                                   "lastedit_user__profile", "thread_users__profile")
+    posts = posts.select_related(*auth.POST_SELECT_RELATED).prefetch_related("thread_users__profile")
     # Filter deleted items for anonymous and non-moderators.
     if user.is_anonymous or (user.is_authenticated and not user.profile.is_moderator):
         posts = posts.exclude(status=Post.DELETED)
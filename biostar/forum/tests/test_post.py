@@ -1,5 +1,5 @@
 import logging
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from biostar.forum import models, views, auth, ajax
 from biostar.forum.tests.util import fake_request
@@ -127,6 +127,102 @@ class PostTest(TestCase):
         self.process_response(response)
         return
 
+    def test_tag_filter(self):
+        "Test filtering the post list by tags"
+
+        models.Post.objects.create(title="Tagged", author=self.owner, content="Test",
+                                   type=models.Post.QUESTION, tag_val="foo,bar")
+
+        posts = views.get_posts(user=self.owner, tag="FOO+baz")
+        self.assertEqual([p.title for p in posts], ["Tagged"], "Invalid tag filtering")
+
+        # The query string decodes tag=foo+baz to a space.
+        posts = views.get_posts(user=self.owner, tag="foo baz")
+        self.assertEqual([p.title for p in posts], ["Tagged"], "Invalid tag filtering")
+
+    def test_reply_counts(self):
+        "Test the root and parent counts after adding replies"
+
+        answer = models.Post.objects.create(title="Test", author=self.owner, content="Test",
+                                            type=models.Post.ANSWER, parent=self.post)
+        models.Post.objects.create(title="Test", author=self.owner, content="Test",
+                                   type=models.Post.COMMENT, parent=answer)
+
+        self.post.refresh_from_db()
+        answer.refresh_from_db()
+
+        self.assertEqual((self.post.reply_count, self.post.answer_count, self.post.comment_count), (2, 1, 1),
+                         "Invalid root counts")
+        self.assertEqual((answer.reply_count, answer.comment_count), (1, 1), "Invalid parent counts")
+
+    def test_thread_contributor(self):
+        "Test the root tracks the last contributor of the thread"
+
+        user2 = User.objects.create(username="user2", email="user2@tested.com", password="tested")
+        answer = models.Post.objects.create(title="Test", author=user2, content="Test",
+                                            type=models.Post.ANSWER, parent=self.post)
+        models.Post.objects.create(title="Test", author=self.owner, content="Test",
+                                   type=models.Post.COMMENT, parent=answer)
+
+        user3 = User.objects.create(username="user3", email="user3@tested.com", password="tested")
+        models.Post.objects.create(title="Test", author=user3, content="Test",
+                                   type=models.Post.COMMENT, parent=answer)
+
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.last_contributor, self.post.lastedit_user), (user3, user3),
+                         "Invalid thread contributor")
+
+    def test_mention_subscription(self):
+        "Test users mentioned in a new question are subscribed to it"
+
+        user2 = User.objects.create(username="user2", email="user2@tested.com", password="tested")
+        user2.refresh_from_db()
+        post = models.Post.objects.create(title="Test", author=self.owner, content=f"Hello @{user2.username}",
+                                          type=models.Post.QUESTION)
+
+        subscribed = models.Subscription.objects.filter(post=post, user=user2).exists()
+        self.assertTrue(subscribed, "Mentioned user not subscribed")
+
+    def test_post_views(self):
+        "Test repeated views from the same address are counted once"
+
+        url = reverse("post_view", kwargs=dict(uid=self.post.uid))
+        for step in range(2):
+            request = fake_request(url=url, data={}, user=self.owner, method="GET")
+            auth.update_post_views(post=self.post, request=request)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 1, "Invalid view count")
+
+    @override_settings(POST_VIEW_CACHE="views",
+                       CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                               "views": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                                         "LOCATION": "post-views"}})
+    def test_post_views_cache(self):
+        "Test repeated views are skipped through the post view cache"
+
+        url = reverse("post_view", kwargs=dict(uid=self.post.uid))
+        for step in range(2):
+            request = fake_request(url=url, data={}, user=self.owner, method="GET")
+            auth.update_post_views(post=self.post, request=request)
+            # The cache alone remembers the view.
+            models.PostView.objects.all().delete()
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.view_count, 1, "Invalid view count")
+
+    def test_html_rerender(self):
+        "Test the html is rendered again only when the content changes"
+
+        self.post.refresh_from_db()
+        self.assertTrue(self.post.content_hash, "Content hash not set on save")
+
+        self.post.content = "Changed **content**"
+        self.post.save()
+        self.post.refresh_from_db()
+
+        self.assertIn("<strong>content</strong>", self.post.html, "Html not updated after content change")
+
     def test_markdown(self):
         "Test the markdown rendering"
         from django.core import management
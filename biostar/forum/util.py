@@ -1,9 +1,10 @@
 import re
-import bleach
 import logging
+import secrets
 import uuid
 
 from datetime import datetime
+from django.db.models import F, Func, Subquery, IntegerField
 from django.utils.timezone import utc
 
 
@@ -19,12 +20,30 @@ def get_uuid(limit=32):
     return str(uuid.uuid4())[:limit]
 
 
+def get_uid():
+    "Random 16 character id, used as a field default"
+    return secrets.token_hex(8)
+
+
+# Matches html tags.
+TAG_PATTERN = re.compile(r"<[^>]*>")
+
+
 def strip_tags(text):
     "Strip html tags from text"
-    text = bleach.clean(text, tags=[], attributes={}, styles=[], strip=True)
+    text = TAG_PATTERN.sub("", text or "")
     return text
 
 
+def count_subquery(query):
+    """
+    Subquery counting the rows of a query that is correlated to the outer query with OuterRef.
+    """
+    # COUNT as a plain function keeps the subquery free of a GROUP BY, so it always returns a row.
+    query = query.order_by().annotate(count=Func(F("pk"), function="COUNT")).values("count")
+    return Subquery(query, output_field=IntegerField())
+
+
 def pluralize(value, word):
     if value > 1:
         return "%d %ss" % (value, word)
@@ -1,4 +1,5 @@
 import logging
+import re
 from datetime import timedelta
 from functools import wraps
 
@@ -8,7 +9,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.core.paginator import Paginator
-from django.db.models import Count
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, Exists, OuterRef
 from django.shortcuts import render, redirect, reverse
 
 from . import forms, auth, tasks, util
@@ -51,6 +53,9 @@ ORDER_MAPPER = dict(
 
 )
 
+# Multiple tags may be separated by commas or plus signs, a plus in the query string arrives as a space.
+TAG_SPLITTER = re.compile(r"[,+\s]")
+
 
 def post_exists(func):
     """
@@ -93,8 +98,12 @@ def get_posts(user, show="latest", tag="", order="rank", limit=None):
         query = Post.objects.filter(is_toplevel=True)
 
     # Filter by tags if specified.
-    if tag:
-        query = query.filter(tags__name=tag.lower())
+    terms = [term.strip().lower() for term in TAG_SPLITTER.split(tag) if term.strip()]
+    if terms:
+        # A subquery does not duplicate rows the way a join on the tags would.
+        tagged = Post.tags.through.objects.filter(content_type=ContentType.objects.get_for_model(Post),
+                                                  object_id=OuterRef("pk"), tag__name__in=terms)
+        query = query.annotate(tagged=Exists(tagged)).filter(tagged=True)
 
     # Apply post ordering.
     if ORDER_MAPPER.get(order):
@@ -114,7 +123,7 @@ def get_posts(user, show="latest", tag="", order="rank", limit=None):
         query = query.exclude(status=Post.DELETED)
 
     # Select related information used during rendering.
-    query = query.prefetch_related("root", "author__profile", "lastedit_user__profile", "thread_users__profile")
+    query = query.select_related(*auth.POST_SELECT_RELATED).prefetch_related("thread_users__profile")
 
     return query
 
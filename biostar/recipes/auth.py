@@ -344,15 +344,13 @@ def has_write_access(user, project):
     if user.is_anonymous:
         return False
 
-    # Users that may access a project.
-    cond1 = (user == project.owner) or user.is_staff
+    # Users that may access a project, compared by id to avoid loading the owner.
+    if user.id == project.owner_id or user.is_staff:
+        return True
 
     # User has been given write access to the project
-    cond2 = models.Access.objects.filter(user=user, project=project,
-                                         access=models.Access.WRITE_ACCESS).first()
-
-    # One of the conditions has to be true.
-    access = cond1 or cond2
+    access = models.Access.objects.filter(user=user, project=project,
+                                          access=models.Access.WRITE_ACCESS).exists()
 
     return access
 
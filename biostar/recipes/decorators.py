@@ -53,12 +53,15 @@ class read_access:
                 messages.error(request, f"You must be logged in to access object id {uid}")
                 return redirect(self.fallback_url())
 
+            # Project owners may read their project.
+            if project.owner_id == user.id:
+                return function(request, *args, **kwargs)
+
             # Check the presence of READ or WRITE access
             read_or_write = [models.Access.READ_ACCESS, models.Access.WRITE_ACCESS]
-            access = models.Access.objects.filter(user=user, project=project, access__in=read_or_write).first()
+            access = models.Access.objects.filter(user=user, project=project, access__in=read_or_write).exists()
 
-            # Project owners may read their project.
-            if access or project.owner == user:
+            if access:
                 return function(request, *args, **kwargs)
 
             # Deny access by default.
@@ -12,13 +12,17 @@ def float_field(data):
     min_value, max_value = numrange[0], numrange[1]
 
     label = data.get("label")
-    widget = forms.NumberInput()
+    # Fields instantiate widget classes directly, avoiding a deepcopy of an instance.
+    widget = forms.NumberInput
     help_text = data.get("help", f"Enter number between {min_value} and {max_value}")
     initial = data.get("value", 1)
 
     field = forms.FloatField(widget=widget, initial=initial, min_value=min_value, max_value=max_value,
                              help_text=help_text, label=label, required=False)
 
+    # Templates branch on the kind of field instead of inspecting the widget.
+    field.kind = "float"
+
     return field
 
 
@@ -35,6 +39,8 @@ def select_field(data, choicefunc=None):
     widget = forms.Select(choices=choices, attrs={"class": "ui dropdown"})
     field = forms.CharField(widget=widget, initial=initial, label=label, help_text=help_text)
 
+    field.kind = "select"
+
     return field
 
 
@@ -47,6 +53,8 @@ def char_field(data):
     field = forms.CharField(initial=initial, label=label, help_text=help_text, max_length=32,
                             required=False)
 
+    field.kind = "text"
+
     return field
 
 
@@ -59,6 +67,8 @@ def radioselect_field(obj):
     widget = forms.RadioSelect(choices=choices)
     field = forms.CharField(widget=widget, initial=initial, label=label, help_text=help_text)
 
+    field.kind = "radio"
+
     return field
 
 
@@ -66,7 +76,7 @@ def number_field(data):
     numrange = data.get("range", [0, 1])
     min_value, max_value = min(numrange), max(numrange)
     label = data.get("label", "")
-    widget = forms.NumberInput()
+    widget = forms.NumberInput
     help_text = data.get("help", f"Range: {min_value} and {max_value}")
     initial = data.get("value", 0)
 
@@ -75,6 +85,8 @@ def number_field(data):
         help_text=help_text, widget=widget
     )
 
+    field.kind = "int"
+
     return field
 
 
@@ -86,6 +98,8 @@ def checkbox_field(data):
 
     field = forms.BooleanField(initial=initial, widget=widget, label=label, help_text=help_text, required=False)
 
+    field.kind = "checkbox"
+
     return field
 
 
@@ -100,14 +114,12 @@ def data_field_generator(field, project, type="", extras=[]):
         type = type.replace(" ", '')
         query = query.filter(type__iregex=type)
 
-    query = query.order_by("rank", "-date")
-
-    # Create a mapping of data to id.
-    datamap = dict((obj.id, obj) for obj in query)
+    # Only the id and name are needed for the choices.
+    query = query.order_by("rank", "-date").values_list("id", "name")
 
     # The choice generator.
     def choice_func():
-        choices = extras + [(d.id, d.name) for d in datamap.values()]
+        choices = extras + list(query)
         return choices
 
     # Returns a SELECT field with the choices.
@@ -119,9 +131,6 @@ def dynamic_field(data, project=None):
     Creates a DJANGO form field from a dictionary.
     """
 
-    # Get the known field types.
-    field_types = get_field_types()
-
     if not hasattr(data, 'get'):
         # Not a "dictionary-like" data
         return None
@@ -147,7 +156,7 @@ def dynamic_field(data, project=None):
 
     else:
         # In all other cases we generate a field from the tupe.
-        func = field_types.get(display_type)
+        func = FIELD_TYPES.get(display_type)
         if not func:
             logger.error(f"Invalid display type={display_type}")
             return None
@@ -156,18 +165,19 @@ def dynamic_field(data, project=None):
     return field
 
 
+# Maps strings constants to field types.
+FIELD_TYPES = {
+    const.RADIO: radioselect_field,
+    const.DROPDOWN: select_field,
+    const.INTEGER: number_field,
+    const.TEXTBOX: char_field,
+    const.FLOAT: float_field,
+    const.CHECKBOX: checkbox_field,
+}
+
+
 def get_field_types():
     """
     Maps strings constants to field types.
     """
-
-    field_types = {
-        const.RADIO: radioselect_field,
-        const.DROPDOWN: select_field,
-        const.INTEGER: number_field,
-        const.TEXTBOX: char_field,
-        const.FLOAT: float_field,
-        const.CHECKBOX: checkbox_field,
-    }
-
-    return field_types
+    return FIELD_TYPES
@@ -1,7 +1,6 @@
 import logging
 
 import hjson
-import mistune
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -10,7 +9,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 from django.conf import settings
-from biostar.accounts.models import User
+from biostar.accounts.models import User, make_html
 from . import util
 from .const import *
 
@@ -26,11 +25,6 @@ class Bunch(object):
         self.__dict__.update(kwargs)
 
 
-def make_html(text):
-    html = mistune.markdown(text)
-    return html
-
-
 def image_path(instance, filename):
     # Name the data by the filename.
     name, ext = os.path.splitext(filename)
@@ -6,6 +6,7 @@ from textwrap import dedent
 import hashlib
 import urllib.parse
 
+from functools import lru_cache
 from datetime import timedelta, datetime
 from django.contrib import messages
 from django import template
@@ -14,6 +15,8 @@ from django.contrib.staticfiles.templatetags.staticfiles import static
 from django.core.paginator import Paginator
 from django.db.models import Q,Count
 from django.template import defaultfilters
+from django.template.loader import render_to_string
+from django.utils.html import format_html, format_html_join
 from django.utils.safestring import mark_safe
 
 from biostar.recipes import auth, util, const
@@ -179,14 +182,8 @@ def paste(context, project, current=""):
 @register.filter
 def is_checkbox(field):
     "Check if current field is a checkbox"
-
-    try:
-        if field.field.widget.input_type == "checkbox":
-            return True
-    except Exception as exc:
-        logger.error(exc)
-
-    return False
+    # Fields built by the recipe factory carry their kind.
+    return getattr(field.field, "kind", "") == "checkbox"
 
 
 @register.filter
@@ -232,12 +229,18 @@ def data_color(data):
     return DATA_COLORS.get(data.state, "")
 
 
+@lru_cache(maxsize=1024)
+def type_labels(types):
+    """
+    Builds the labels for a comma separated type string.
+    """
+    return format_html_join("", "<span class='ui label' > {} </span>", ((t,) for t in types.split(',')))
+
+
 @register.simple_tag
 def type_label(data):
     if data.type:
-        label = lambda x: f"<span class='ui label' > {x} </span>"
-        types = [label(t) for t in data.type.split(',')]
-        return mark_safe(''.join(types))
+        return type_labels(data.type)
     return ""
 
 
@@ -302,9 +305,16 @@ def access_form(project, user, form):
     return dict(project=project, user=user, form=form)
 
 
-@register.inclusion_tag('widgets/job_elapsed.html')
+@register.simple_tag
 def job_minutes(job):
-    return dict(job=job)
+    """
+    Returns the job state label followed by the runtime.
+    """
+    label = format_html('<div class="ui {} label">{}</div>', job_color(job), job.get_state_display())
+    elapsed = job.elapsed()
+    if elapsed:
+        label += format_html(" Runtime {}", elapsed)
+    return label
 
 
 @register.simple_tag
@@ -312,9 +322,7 @@ def size_label(data):
     """
     Returns a label for data sizes.
     """
-
-    size = f"{defaultfilters.filesizeformat(data.size)}"
-    return mark_safe(f"<span class='ui mini label'>{size}</span>")
+    return format_html("<span class='ui mini label'>{}</span>", defaultfilters.filesizeformat(data.size))
 
 
 @register.inclusion_tag('widgets/directory_list.html', takes_context=True)
@@ -384,6 +392,14 @@ def form_errors(form):
     return context
 
 
+@lru_cache(maxsize=4096)
+def cached_html(text):
+    """
+    Renders markdown once per distinct text; list pages repeat the same summaries.
+    """
+    return make_html(dedent(text))
+
+
 @register.filter
 def markdown(text):
     """
@@ -391,14 +407,23 @@ def markdown(text):
     """
     if not text:
         return ''
-    text = dedent(text)
-    html = make_html(text)
+    html = cached_html(text)
     return mark_safe(html)
 
 
+@lru_cache(maxsize=16)
+def menubar_links(enable_forum, only_enable_forum):
+    """
+    Renders the menubar links that are the same for every user.
+    """
+    context = dict(enable_forum=enable_forum, only_enable_forum=only_enable_forum)
+    return mark_safe(render_to_string("widgets/menubar_links.html", context=context))
+
+
 @register.inclusion_tag("widgets/menubar.html", takes_context=True)
 def menubar(context, request=None, with_search=True):
     user = context.request.user
-    context.update(dict(user=user, request=request, with_search=with_search))
+    links = menubar_links(bool(context.get("enable_forum")), bool(context.get("only_enable_forum")))
+    context.update(dict(user=user, request=request, with_search=with_search, links=links))
 
     return context
@@ -75,6 +75,7 @@ class FactoryTest(TestCase):
             if not field:
                 message = f"field generator for display={display_type} failed"
                 self.assertFalse(message)
+            self.assertTrue(getattr(field, "kind", ""), f"field kind for display={display_type} not set")
 
     def test_dynamic_field(self):
         "Test data generator"
@@ -2,24 +2,41 @@ import logging
 import time
 import re
 import os
-import html2text
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool, get_context
 from taggit.models import Tag
 
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, reset_queries
+from django.db.models import OuterRef
 from biostar.accounts.models import User, Profile
 from biostar.forum import util
-from biostar.forum.models import Post, Vote, Subscription, Badge, Award
-from biostar.transfer.models import UsersUser, PostsPost, PostsVote, PostsSubscription, BadgesAward
+from biostar.forum.models import Post, Vote, Subscription, Badge, Award, count_posts
+from biostar.transfer.util import html_to_markdown
+from biostar.transfer.models import UsersUser, UsersProfile, PostsPost, PostsVote, PostsSubscription, BadgesBadge, \
+    BadgesAward
 
 from biostar.utils import markdown
 logger = logging.getLogger("engine")
-from itertools import count, islice
+from itertools import islice
 
 
 LIMIT = None
 
-def timer_func():
+# Rows fetched per round trip when streaming the source tables.
+CHUNK_SIZE = 2000
+
+
+def batch_size(model):
+    """
+    Rows per bulk query, kept under the 65535 parameters postgres accepts in one statement.
+    """
+    return min(getattr(settings, "BULK_BATCH_SIZE", 1000), 65535 // len(model._meta.concrete_fields))
+
+
+def timer_func(msg="", step=5000):
     """
     Prints progress on inserting elements.
     """
@@ -33,14 +50,26 @@ def timer_func():
         last = now
         print(f"{msg} in {sec} seconds")
 
-    def progress(index, step=5000, msg=""):
-        nonlocal last
+    def progress(index):
         if index % step == 0:
             elapsed(f"... {index} {msg}")
 
     return elapsed, progress
 
 
+def is_html(text):
+    "Post bodies starting with a tag are html"
+    return text.strip().startswith("<")
+
+
+def id_map(pairs):
+    """
+    Maps the integer source ids to target primary keys from (uid, pk) pairs.
+    Transferred rows keep the source id as uid, other uids can not match a source id.
+    """
+    return {int(uid): pk for uid, pk in pairs if uid and uid.isdigit()}
+
+
 def uid_from_context(context):
     """
     Parse post.uid from a link
@@ -52,29 +81,43 @@ def uid_from_context(context):
     return uid
 
 
+def with_profiles(users):
+    """
+    Pairs each source user with its profile, loading the profiles one chunk of users at a time.
+    """
+    while True:
+        chunk = list(islice(users, CHUNK_SIZE))
+        if not chunk:
+            return
+        profiles = UsersProfile.objects.filter(user_id__in=[user.id for user in chunk]).in_bulk(field_name="user_id")
+        for user in chunk:
+            yield user, profiles.get(user.id)
+
+
 def bulk_copy_users(limit):
 
     current = dict()
-    existing = [u.username for u in User.objects.all()]
+    # A set makes the username check constant time.
+    existing = set(User.objects.values_list("username", flat=True))
 
     def gen_users():
         nonlocal existing
         logger.info(f"Transferring users")
 
-        users = UsersUser.objects.order_by("id")
+        users = UsersUser.objects.order_by("id").iterator(chunk_size=CHUNK_SIZE)
         # Only iterate over users that do not exist already
 
-        elapsed, progress = timer_func()
+        elapsed, progress = timer_func(msg="users")
 
         # Allow limiting the input
-        stream = islice(zip(count(1), users), limit)
-        for index, user in stream:
-            progress(index=index,  msg="users")
+        stream = islice(enumerate(with_profiles(users), 1), limit)
+        for index, (user, profile) in stream:
+            progress(index)
             # Set the username to twitter id or a default
             # Extra prefix 'username' necessary in default to avoid duplicating
             # from already migrated/populated users: user-1, user-2
             default_username = f'user-{user.id}'
-            username = user.profile.twitter_id or default_username
+            username = profile.twitter_id or default_username
             if username in existing:
                 username = f'user-{util.get_uuid(limit=5)}'
 
@@ -83,7 +126,7 @@ def bulk_copy_users(limit):
                             is_active=user.is_active, is_superuser=user.is_admin, is_staff=user.is_staff)
 
             current[user.email] = new_user
-            existing.append(username)
+            existing.add(username)
 
             yield new_user
 
@@ -91,249 +134,282 @@ def bulk_copy_users(limit):
         logger.info(f"Transferring profiles")
 
         # Exclude existing users from source database.
-        users = UsersUser.objects.all().order_by("id")
+        users = UsersUser.objects.all().order_by("id").iterator(chunk_size=CHUNK_SIZE)
 
-        elapsed, progress = timer_func()
+        elapsed, progress = timer_func(msg="profiles")
 
         # Allow limiting the input
-        stream = islice(zip(count(1), users), limit)
-        for index, user in stream:
-            progress(index, msg="profiles")
-            text = util.strip_tags(user.profile.info)
+        stream = islice(enumerate(with_profiles(users), 1), limit)
+        for index, (user, source) in stream:
+            progress(index)
+            text = util.strip_tags(source.info)
 
             profile = Profile(uid=user.id, user=current.get(user.email), name=user.name,
-                              role=user.type, last_login=user.last_login, html=user.profile.info,
-                              date_joined=user.profile.date_joined, location=user.profile.location,
-                              website=user.profile.website, scholar=user.profile.scholar, text=text,
-                              score=user.score, twitter=user.profile.twitter_id, my_tags=user.profile.my_tags,
-                              digest_prefs=user.profile.digest_prefs, new_messages=user.new_messages)
+                              role=user.type, last_login=user.last_login, html=source.info,
+                              date_joined=source.date_joined, location=source.location,
+                              website=source.website, scholar=source.scholar, text=text,
+                              score=user.score, twitter=source.twitter_id, my_tags=source.my_tags,
+                              digest_prefs=source.digest_prefs, new_messages=user.new_messages)
 
             yield profile
 
-    # Bulk create the users, then profile.
+    # Bulk create the users, then profile. The created objects are counted instead of the tables.
     elapsed, progress = timer_func()
 
-    User.objects.bulk_create(objs=gen_users(), batch_size=10000)
-    ucount = User.objects.all().count()
+    ucount = len(User.objects.bulk_create(objs=gen_users(), batch_size=batch_size(User)))
     elapsed(f"transferred {ucount} users")
 
-    Profile.objects.bulk_create(objs=gen_profile(), batch_size=10000)
-    pcount = Profile.objects.all().count()
+    pcount = len(Profile.objects.bulk_create(objs=gen_profile(), batch_size=batch_size(Profile)))
     elapsed(f"transferred {pcount} profiles")
 
 
 def bulk_copy_votes(limit):
-    posts = PostsVote.objects.all()
+    posts = PostsVote.objects.all().iterator(chunk_size=CHUNK_SIZE)
 
     def gen_votes():
         logger.info("Transferring Votes")
-        posts_set = {post.uid: post for post in Post.objects.all()}
-        users_set = {user.profile.uid: user for user in User.objects.all()}
-        stream = zip(count(1), posts)
+        # Only the ids are needed, posts without a root are left out.
+        posts_set = id_map(Post.objects.filter(root__isnull=False).values_list("uid", "pk"))
+        users_set = id_map(User.objects.values_list("profile__uid", "pk"))
+        stream = enumerate(posts, 1)
         stream = islice(stream, limit)
 
-        elapsed, progress = timer_func()
+        elapsed, progress = timer_func(msg="votes")
         for index, vote in stream:
-            progress(index, msg="votes")
-            post = posts_set.get(str(vote.post_id))
-            author = users_set.get(str(vote.author_id))
+            progress(index)
+            post = posts_set.get(vote.post_id)
+            author = users_set.get(vote.author_id)
             # Skip existing votes and incomplete post/author information.
-            if not (post and author) or not post.root:
+            if not (post and author):
                 continue
 
-            vote = Vote(post=post, author=author, type=vote.type, uid=vote.id,
+            vote = Vote(post_id=post, author_id=author, type=vote.type, uid=vote.id,
                         date=vote.date)
             yield vote
-    # Bulk create the users, then profile.
+    # Votes that were transferred before are skipped by the database, the count includes them.
     elapsed, progress = timer_func()
-    Vote.objects.bulk_create(objs=gen_votes(), batch_size=1000)
-    vcount = Vote.objects.all().count()
-    elapsed(f"transferred {vcount} votes")
+    vcount = len(Vote.objects.bulk_create(objs=gen_votes(), batch_size=batch_size(Vote), ignore_conflicts=True))
+    elapsed(f"processed {vcount} votes")
 
 
 def bulk_copy_posts(limit):
-    relations = {}
-    all_users = User.objects.order_by("id")
-    users_set = {user.profile.uid: user for user in all_users}
+    users_set = id_map(User.objects.values_list("profile__uid", "pk"))
+
+    def convert_html(stream, pool):
+        """
+        Adds whether a post is html and its markdown to the stream, converted in the worker pool one chunk at a time.
+        """
+        while True:
+            chunk = list(islice(stream, CHUNK_SIZE))
+            if not chunk:
+                return
+            # Only posts that will be transferred are converted.
+            posts = [post for index, post in chunk if post.author_id in users_set and is_html(post.content)]
+            texts = pool.map(html_to_markdown, [post.content for post in posts], chunksize=128)
+            texts = dict(zip([post.id for post in posts], texts))
+            for index, post in chunk:
+                yield index, post, post.id in texts, texts.get(post.id)
 
     def gen_posts():
         logger.info("Transferring posts")
 
-        posts = PostsPost.objects.order_by("id")
-        elapsed, progress = timer_func()
-        stream = zip(count(1), posts)
+        posts = PostsPost.objects.order_by("id").iterator(chunk_size=CHUNK_SIZE)
+        elapsed, progress = timer_func(msg="posts")
+        stream = enumerate(posts, 1)
         stream = islice(stream, limit)
 
-        for index, post in stream:
-            progress(index, msg="posts")
-
-            author = users_set.get(str(post.author_id))
-            lastedit_user = users_set.get(str(post.lastedit_user_id))
-            # Incomplete author information loaded or existing posts.
-            if not (author and lastedit_user):
-                continue
+        # Spawned workers do not inherit the open database connections.
+        with ProcessPoolExecutor(mp_context=get_context("spawn")) as pool:
+            for index, post, force_text, text in convert_html(stream, pool):
+                progress(index)
+
+                author = users_set.get(post.author_id)
+                # Incomplete author information loaded or existing posts.
+                if not author:
+                    continue
+                # Fall back to the author when the last editor was not transferred.
+                lastedit_user = users_set.get(post.lastedit_user_id) or author
+
+                is_toplevel = post.type in Post.TOP_LEVEL
+
+                rank = post.lastedit_date.timestamp()
+                # Convert the content to markdown if its html
+                if force_text:
+                    content = text
+                    if content is None:
+                        content = post.content
+                        logger.error(f"Failed parsing post={post.id}.")
+
+                    html = markdown.parse(content)
+                else:
+                    content = post.content
+                    html = post.html
 
-            is_toplevel = post.type in Post.TOP_LEVEL
+                new_post = Post(uid=post.id, html=html, type=post.type, is_toplevel=is_toplevel,
+                                lastedit_user_id=lastedit_user, thread_votecount=post.thread_score,
+                                author_id=author, status=post.status, rank=rank, accept_count=int(post.has_accepted),
+                                lastedit_date=post.lastedit_date, book_count=post.book_count,
+                                content=content, title=post.title, vote_count=post.vote_count,
+                                creation_date=post.creation_date, tag_val=post.tag_val,
+                                view_count=post.view_count)
 
-            rank = post.lastedit_date.timestamp()
-            # Convert the content to markdown if its html
+                yield new_post
 
-            force_text = post.content.strip().startswith("<")
-            if force_text:
-                try:
-                    content = html2text.html2text(post.content, bodywidth=0)
-                except Exception as exc:
-                    content = post.content
-                    logger.error(f"Failed parsing post={post.id}.")
+    def add_tags():
+        logger.info("Transferring tags")
 
-                html = markdown.parse(content)
-            else:
-                content = post.content
-                html = post.html
+        # Split the tag values in a single pass, the posts are not loaded as models.
+        pairs = []
+        posts = Post.objects.values_list("pk", "tag_val").iterator(chunk_size=CHUNK_SIZE)
+        for pk, tag_val in posts:
+            pairs.extend((pk, name) for name in tag_val.lower().split(",") if name)
+        names = {name for pk, name in pairs}
 
-            new_post = Post(uid=post.id, html=html, type=post.type, is_toplevel=is_toplevel,
-                            lastedit_user=lastedit_user, thread_votecount=post.thread_score,
-                            author=author, status=post.status, rank=rank, accept_count=int(post.has_accepted),
-                            lastedit_date=post.lastedit_date, book_count=post.book_count,
-                            content=content, title=post.title, vote_count=post.vote_count,
-                            creation_date=post.creation_date, tag_val=post.tag_val,
-                            view_count=post.view_count)
+        # Create the missing tags in bulk, the slug is normally filled in by Tag.save().
+        tags = dict(Tag.objects.filter(name__in=names).values_list("name", "pk"))
+        missing = [Tag(name=name, slug=Tag().slugify(name)) for name in names - set(tags)]
+        Tag.objects.bulk_create(objs=missing, batch_size=batch_size(Tag), ignore_conflicts=True)
+        tags.update(Tag.objects.filter(name__in=names).values_list("name", "pk"))
 
-            # Store parent and root for every post.
-            relations[str(new_post.uid)] = [str(post.root_id), str(post.parent_id)]
-            yield new_post
+        # Names whose slug collides with an existing tag are left to the suffixing in Tag.save().
+        for name in names - set(tags):
+            tags[name] = Tag.objects.get_or_create(name=name)[0].pk
 
-    def add_tags():
-        logger.info("Transferring tags")
-        for post in Post.objects.all():
-            tags = [Tag.objects.get_or_create(name=name)[0] for name in post.parse_tags()]
-            post.tags.add(*tags)
+        TaggedItem = Post.tags.through
+        content_type = ContentType.objects.get_for_model(Post)
+        items = (TaggedItem(content_type=content_type, object_id=pk, tag_id=tags[name]) for pk, name in pairs)
+        TaggedItem.objects.bulk_create(objs=items, batch_size=batch_size(TaggedItem), ignore_conflicts=True)
 
     def set_counts():
         logger.info("Setting post counts")
-        descendants = lambda p: Post.objects.filter(root=p) if p.is_toplevel else Post.objects.filter(parent=p)
-        posts = {post: (descendants(post).exclude(id=post.id).filter(type=Post.ANSWER).count(),
-                        descendants(post).exclude(id=post.id).filter(type=Post.COMMENT).count())
-                 for post in Post.objects.all()}
-
-        for post in posts:
-            answer_count, comment_count = posts[post][0], posts[post][1]
-            post.reply_count = answer_count + comment_count
-            post.answer_count = answer_count
-            post.comment_count = comment_count
-            yield post
+        # Top level posts count their whole thread, the others their direct children.
+        for field, is_toplevel in (("root", True), ("parent", False)):
+            Post.objects.filter(is_toplevel=is_toplevel).update(
+                answer_count=count_posts(field, type=Post.ANSWER),
+                comment_count=count_posts(field, type=Post.COMMENT),
+                reply_count=count_posts(field, type__in=(Post.ANSWER, Post.COMMENT)))
 
     def gen_updates():
         logger.info("Updating post relations")
-        posts = {post.uid: post for post in Post.objects.all()}
-        for pid in relations:
-            root_uid, parent_uid = relations[pid][0], relations[pid][1]
-            post = posts[pid]
-            root = posts.get(root_uid)
-            parent = posts.get(parent_uid)
-            if not (root and parent):
+        posts = id_map(Post.objects.values_list("uid", "pk"))
+        # Transferred posts keep the source id as uid, stream the relations back from the source.
+        relations = PostsPost.objects.values_list("id", "root_id", "parent_id").iterator(chunk_size=CHUNK_SIZE)
+        for pid, root_id, parent_id in relations:
+            post = posts.get(pid)
+            root = posts.get(root_id)
+            parent = posts.get(parent_id)
+            if not (post and root and parent):
                 continue
-            post.root = root
-            post.parent = parent
-            yield post
+            yield Post(pk=post, root_id=root, parent_id=parent)
 
     def update_threadusers():
         logger.info("Updating thread users.")
-        roots = Post.objects.filter(type__in=Post.TOP_LEVEL)
-        # Get all authors belonging to descendants of root
-        get_authors = lambda root: Post.objects.filter(root=root).values_list("author")
-        # Create dict key by root and its contributors
-        roots = {root: User.objects.filter(pk__in=get_authors(root=root)) for root in roots}
-        for post in roots:
-            users = roots[post]
-            if post.root.thread_users.filter(pk__in=users):
-                continue
-
-            post.thread_users.add(*users)
+        # Every distinct author in a thread, paired with the root of that thread.
+        pairs = Post.objects.filter(root__is_toplevel=True).values_list("root_id", "author_id").distinct()
+        ThreadUser = Post.thread_users.through
+        users = (ThreadUser(post_id=root, user_id=author) for root, author in pairs.iterator(chunk_size=CHUNK_SIZE))
+        ThreadUser.objects.bulk_create(objs=users, batch_size=batch_size(ThreadUser), ignore_conflicts=True)
 
     def gen_awards():
         logger.info("Transferring awards.")
-        # Query the badges
-        badges = {badge.name: badge for badge in Badge.objects.all()}
-        awards = BadgesAward.objects.all()
+        # Map the source badge ids to the target badges by name.
+        targets = dict(Badge.objects.values_list("name", "pk"))
+        badges = {pk: targets.get(name) for pk, name in BadgesBadge.objects.values_list("id", "name")}
+        posts = id_map(Post.objects.values_list("uid", "pk"))
+        awards = BadgesAward.objects.all().iterator(chunk_size=CHUNK_SIZE)
 
-        stream = zip(count(1), awards)
+        stream = enumerate(awards, 1)
         stream = islice(stream, limit)
-        elapsed, progress = timer_func()
+        elapsed, progress = timer_func(msg="awards")
         for index, award in stream:
-            progress(index, msg="awards")
-            badge = badges[award.badge.name]
-            user = users_set.get(str(award.user_id))
+            progress(index)
+            badge = badges.get(award.badge_id)
+            user = users_set.get(award.user_id)
             # Get post uid from context
             post_uid = uid_from_context(award.context)
-            post = Post.objects.filter(uid=post_uid).first()
-            # Bail when a user or post do not exist
-            if not user or (post_uid and not post):
+            post = posts.get(int(post_uid)) if post_uid else None
+            # Bail when a badge, user or post do not exist
+            if not (badge and user) or (post_uid and not post):
                 continue
-            award = Award(date=award.date, post=post, badge=badge, user=user, uid=award.id)
+            award = Award(date=award.date, post_id=post, badge_id=badge, user_id=user, uid=award.id)
 
             yield award
 
     elapsed, progress = timer_func()
-    Post.objects.bulk_create(objs=gen_posts(), batch_size=1000)
-    pcount = Post.objects.all().count()
-    elapsed(f"transferred {pcount} posts")
+    pcount = len(Post.objects.bulk_create(objs=gen_posts(), batch_size=batch_size(Post), ignore_conflicts=True))
+    elapsed(f"processed {pcount} posts")
 
-    Post.objects.bulk_update(objs=gen_updates(), fields=["root", "parent"], batch_size=1000)
+    Post.objects.bulk_update(objs=gen_updates(), fields=["root", "parent"], batch_size=batch_size(Post))
     update_threadusers()
     add_tags()
-    elapsed(f"Updated {pcount} post threads")
+    elapsed("Updated post threads")
 
-    Post.objects.bulk_update(objs=set_counts(), fields=["reply_count", "comment_count", "answer_count"], batch_size=1000)
-    elapsed(f"Set {pcount} post counts.")
+    set_counts()
+    elapsed("Set post counts.")
 
-    Award.objects.bulk_create(objs=gen_awards(), batch_size=10000)
-    acount = Award.objects.all().count()
-    elapsed(f"transferred {acount} awards")
+    acount = len(Award.objects.bulk_create(objs=gen_awards(), batch_size=batch_size(Award), ignore_conflicts=True))
+    elapsed(f"processed {acount} awards")
 
 
 def bulk_copy_subs(limit):
     def generate():
-        users = {user.profile.uid: user for user in User.objects.all()}
-        posts = {post.uid: post for post in Post.objects.all()}
-        subs = PostsSubscription.objects.all()
+        users = id_map(User.objects.values_list("profile__uid", "pk"))
+        posts = id_map(Post.objects.values_list("uid", "pk"))
+        subs = PostsSubscription.objects.all().iterator(chunk_size=CHUNK_SIZE)
 
         logger.info("Copying subscriptions")
-        elapsed, progress = timer_func()
-        stream = zip(count(1), subs)
+        elapsed, progress = timer_func(msg="subscriptions")
+        stream = enumerate(subs, 1)
         stream = islice(stream, limit)
         for index, sub in stream:
-            progress(index, msg="subscriptions")
-            user = users.get(str(sub.user_id))
-            post = posts.get(str(sub.post_id))
+            progress(index)
+            user = users.get(sub.user_id)
+            post = posts.get(sub.post_id)
 
             # Skip incomplete data
             if not (user and post):
                 continue
-            sub = Subscription(uid=sub.id, type=sub.type, user=user, post=post, date=sub.date)
+            sub = Subscription(uid=sub.id, type=sub.type, user_id=user, post_id=post, date=sub.date)
 
             yield sub
 
-    def update_counts():
-        logger.info("Updating post subs_count")
-        # Recompute subs_count for
-        posts_set = {post: post.subs.exclude(user=post.author).count() for post in Post.objects.all()}
-        for post in posts_set:
-            post.subs_count = posts_set[post]
-            yield post
-
     elapsed, progress = timer_func()
-    Subscription.objects.bulk_create(objs=generate(), batch_size=1000)
-    scount = Subscription.objects.all().count()
-    elapsed(f"transferred {scount} subscriptions")
-
-    Post.objects.bulk_update(objs=update_counts(), fields=["subs_count"], batch_size=1000)
-    elapsed(f"Updated {scount} subscription counts")
+    subs = Subscription.objects.bulk_create(objs=generate(), batch_size=batch_size(Subscription), ignore_conflicts=True)
+    scount = len(subs)
+    elapsed(f"processed {scount} subscriptions")
+
+    logger.info("Updating post subs_count")
+    # Count the subscriptions of every post, the author excluded, in a single statement.
+    subs = Subscription.objects.filter(post=OuterRef("pk")).exclude(user=OuterRef("author"))
+    Post.objects.update(subs_count=util.count_subquery(subs))
+    elapsed("Updated subscription counts")
     return
 
 
+def run_phase(func, limit):
+    """
+    Runs a transfer phase, then clears the query log and closes the connections it used.
+    """
+    try:
+        func(limit=limit)
+    finally:
+        # The query log keeps every query when DEBUG is on.
+        reset_queries()
+        connections.close_all()
+
+
+def copy_phase(args):
+    """
+    Runs a single transfer phase, used as the target of the process pool.
+    """
+    name, limit = args
+    phases = dict(votes=bulk_copy_votes, subs=bulk_copy_subs)
+    run_phase(phases[name], limit=limit)
+
+
 class Command(BaseCommand):
-    help = "Migrate users from one database to another."
+    help = "Migrate users from one database to another. " \
+           "The BULK_BATCH_SIZE environment variable sets the rows per bulk query."
 
     def add_arguments(self, parser):
         parser.add_argument('--posts', action="store_true", help="Transfer posts from source database to target.")
@@ -351,25 +427,26 @@ class Command(BaseCommand):
         limit = options.get("limit") or LIMIT
 
         if load_posts:
-            bulk_copy_posts(limit=limit)
+            run_phase(bulk_copy_posts, limit=limit)
             return
         if load_votes:
-            bulk_copy_votes(limit=limit)
+            run_phase(bulk_copy_votes, limit=limit)
             return
         if load_users:
-            bulk_copy_users(limit=limit)
+            run_phase(bulk_copy_users, limit=limit)
             return
         if load_subs:
-            bulk_copy_subs(limit=limit)
+            run_phase(bulk_copy_subs, limit=limit)
             return
 
         # Copy everything
-        bulk_copy_users(limit=limit)
-
-        bulk_copy_posts(limit=limit)
+        run_phase(bulk_copy_users, limit=limit)
 
-        bulk_copy_votes(limit=limit)
+        run_phase(bulk_copy_posts, limit=limit)
 
-        bulk_copy_subs(limit=limit)
+        # Votes and subscriptions only depend on the users and posts and write to separate tables.
+        # The connections are closed after each phase, so none is shared with the forked workers.
+        with Pool(processes=2) as pool:
+            pool.map(copy_phase, [("votes", limit), ("subs", limit)])
 
         return
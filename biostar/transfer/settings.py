@@ -11,6 +11,12 @@ WSGI_APPLICATION = 'conf.examples.postgres.postgres_wsgi.application'
 
 TRANSFER_DATABASE = os.environ.setdefault("TRANSFER_DATABASE", "transfer.db")
 
+# Largest number of rows sent in a single bulk insert or update.
+BULK_BATCH_SIZE = int(os.environ.setdefault("BULK_BATCH_SIZE", "1000"))
+
+# Keep the database connections open between the many bulk queries of a transfer.
+CONN_MAX_AGE = 600
+
 DATABASES = {
 
     'default': {
@@ -20,6 +26,7 @@ DATABASES = {
         'PASSWORD': '',
         'HOST': '',
         'PORT': '',
+        'CONN_MAX_AGE': CONN_MAX_AGE,
     },
 
     'biostar2': {
@@ -29,6 +36,7 @@ DATABASES = {
         'PASSWORD': '',
         'HOST': '',
         'PORT': '',
+        'CONN_MAX_AGE': CONN_MAX_AGE,
         'TEST': {
             'MIRROR': 'default',
         }
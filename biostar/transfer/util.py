@@ -0,0 +1,12 @@
+import html2text
+
+
+def html_to_markdown(text):
+    """
+    Converts html to markdown, returns None when the html can not be parsed.
+    Runs in worker processes so it must not depend on django being set up.
+    """
+    try:
+        return html2text.html2text(text, bodywidth=0)
+    except Exception:
+        return None
@@ -215,6 +215,16 @@ class BiostarInlineLexer(MonkeyPatch):
         return f'<a href="{link}">{link}</a>'
 
 
+def subscribe_mentions(text, root):
+    """
+    Subscribes the users mentioned in the text to the root post, without rendering the text.
+    """
+    handles = {m.group("handle") for m in MENTINONED_USERS.finditer(text)}
+    for user in User.objects.filter(username__in=handles):
+        # Create user subscription if it does not already exist.
+        auth.create_subscription(post=root, user=user, delete_exisiting=False)
+
+
 def parse(text, post=None):
     """
     Parses markdown into html.